@@ -1,17 +1,53 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from typing import Dict, Any
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
-import streamlit.components.v1 as components
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode, DataReturnMode
 
-from common import get_rocm_unique_value, get_rocm_versions
+from common import get_rocm_unique_values, get_rocm_versions
 from packages.balancer import balance, force_refetch_and_update, comments_addition, update_effort
 from packages.ticketfetchers.ticket_fetcher_optimized import TicketFetch
 
 # Constants
 JIRA_BASE_URL = "https://ontrack-internal.amd.com/browse/"
 EFFORT_SIZES = ['S', 'M', 'L', 'XL', '2XL', '3XL', '4XL']
+_EFFORT_INDEX = {size: i for i, size in enumerate(EFFORT_SIZES)}
+
+# Fields the UI actually renders; threaded into balance() so Mongo
+# projects away anything else instead of shipping whole documents.
+GRID_COLUMNS = (
+    'Feature_summary', 'Feature_status',
+    'QA_task', 'QA_status', 'QA_assignee', 'QA_labels',
+    'Auto_task', 'Auto_status',
+    'TMS_task', 'TMS_status',
+    'Effort', 'comments',
+)
+
+# Column order for frames built from Mongo documents; a fixed list lets
+# from_records skip scanning every record to discover the schema.
+TICKET_COLUMNS = ('_id',) + GRID_COLUMNS
+
+# Cap on rows serialized into the grid component. Anything beyond this
+# inflates the JSON payload and mount time without being scrollable in
+# practice; the CSV download still covers the full frame.
+MAX_GRID_ROWS = 1000
+
+# Feature flag: render tickets with the native st.dataframe widget
+# instead of the enterprise AgGrid iframe. The native widget mounts much
+# faster and doesn't re-serialize the frame per rerun; AgGrid stays the
+# default for its filter side bar.
+USE_NATIVE_TABLE = False
+
+# Per-release filter state: a compact immutable tuple instead of a dict,
+# so toggling a filter allocates one small object and comparisons are
+# plain tuple equality.
+Filter = namedtuple('Filter', 'type value column')
+EMPTY_FILTER = Filter(None, None, None)
 
 # Page configuration
 st.set_page_config(
@@ -20,8 +56,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (module-level so the string is built once at import)
+_PAGE_CSS = """
     <style>
     .main > div { padding-top: 2rem; }
     h1 { color: #1f77b4; font-weight: 600; margin-bottom: 2rem; }
@@ -126,7 +162,9 @@ st.markdown("""
         border: none
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_PAGE_CSS, unsafe_allow_html=True)
 
 
 def format_qa_task_key(qa_task: str) -> str:
@@ -139,133 +177,229 @@ def get_ticket_id(feature_id: str, qa_task: str) -> str:
     return f"{feature_id}{format_qa_task_key(qa_task)}"
 
 
+def downcast_ticket_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink the ticket frame's dtypes in place.
+
+    Low-cardinality string columns become category (so comparisons and
+    value_counts run on int8 codes) and int64 columns are downcast to the
+    smallest safe integer width.
+    """
+    if 'Effort' in df.columns:
+        # Fixed ordered categories keep value_counts aligned to
+        # EFFORT_SIZES (zeros included) without a per-render reindex.
+        df['Effort'] = pd.Categorical(
+            df['Effort'], categories=EFFORT_SIZES, ordered=True)
+    for col in ('Feature_status', 'QA_status', 'QA_assignee'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    # Remaining object columns hold one boxed str per cell; Arrow-backed
+    # strings sit in contiguous buffers, which shrinks the frame and
+    # speeds up the serialization Streamlit does per rerun. comments
+    # stays object — it carries lists/HTML, not plain scalars.
+    for col in df.select_dtypes('object').columns:
+        if col != 'comments':
+            df[col] = df[col].astype('string[pyarrow]')
+    for col in df.select_dtypes('int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
 def load_data(release: str, unique_key: int) -> pd.DataFrame:
-    """Load data with caching."""
-    try:
-        with st.spinner(f"⏳ Loading data for {release}..."):
-            data = balance(rocm_version=release, unique_key=str(unique_key))
-            return pd.DataFrame(data)
-    except Exception:  # pylint: disable=broad-except
-        st.warning(f"⚠️ No Tickets Found for {release}")
-        return pd.DataFrame()
+    """Load data, memoized per (release, unique_key) so reruns skip balance().
+
+    Failures propagate to the caller: catching here would cache an
+    empty frame for the whole TTL, pinning a release to "No Tickets
+    Found" after one transient error.
+    """
+    data = balance(rocm_version=release, unique_key=str(unique_key),
+                   columns=GRID_COLUMNS)
+    # from_records builds column arrays directly from the list of
+    # dicts; an already-built frame is reused instead of copied.
+    df = data if isinstance(data, pd.DataFrame) \
+        else pd.DataFrame.from_records(data, columns=list(TICKET_COLUMNS))
+    df = downcast_ticket_frame(df)
+    if '_id' in df.columns:
+        # partition scans once and needs no per-row list allocations,
+        # unlike split; doing it here keeps the result cached.
+        df.insert(0, 'Feature ID',
+                  df['_id'].astype(str).str.partition('|')[0])
+        df = df.drop(columns=['_id'])
+    # comments stays a raw list; the grid's cell renderer joins it
+    # client-side, so no duplicated HTML string is kept per row.
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def get_ticket_fetcher(release: str, unique_key: str) -> TicketFetch:
+    """Share one TicketFetch (auth session + worker pool) per release."""
+    return TicketFetch(max_workers=6, verbose=True,
+                       rocm_version=release, unique_key=unique_key)
 
 
 def load_data_no_cache(release: str, unique_key: int) -> pd.DataFrame:
     """Load fresh data from server without caching."""
     try:
-        tf = TicketFetch(max_workers=6, verbose=True,
-                         rocm_version=release, unique_key=str(unique_key))
+        tf = get_ticket_fetcher(release, str(unique_key))
+        df = tf.fetch_tickets()
+        # Persist the rows we just fetched rather than fetching twice.
         force_refetch_and_update(rocm_version=release,
-                                 unique_key=str(unique_key))
-        return tf.fetch_tickets()
+                                 unique_key=str(unique_key),
+                                 data=df.to_dict("records"))
+        load_data.clear()
+        # The analytics counts are cached separately on the same key;
+        # drop them too so the cards don't serve pre-refresh numbers.
+        compute_analytics_counts.clear()
+        return df
     except Exception:  # pylint: disable=broad-except
         st.warning(f"⚠️ No Tickets Found for {release}")
         return pd.DataFrame()
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
 def convert_df_to_csv(df: pd.DataFrame) -> bytes:
-    """Convert DataFrame to CSV bytes."""
-    return df.to_csv(index=False).encode('utf-8')
+    """Convert DataFrame to CSV bytes, memoized by frame content."""
+    if 'comments' in df.columns:
+        # The frame keeps comments as raw lists; flatten them for the
+        # export so cells stay readable in a spreadsheet.
+        df = df.assign(comments=["<br>".join(c[::-1]) if c is not None and len(c) else ""
+                                 for c in df['comments'].values])
+    # Arrow's C++ CSV writer is several times faster than pandas'
+    # to_csv; decode categoricals first since the writer doesn't take
+    # dictionary columns.
+    cat_cols = df.select_dtypes('category').columns
+    if len(cat_cols):
+        df = df.astype(dict.fromkeys(cat_cols, 'string'))
+    sink = BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue()
+
+
+def invalidate_release_data(release: str, unique_key):
+    """Drop cached frames, counts and derived per-release state.
+
+    Called after an acknowledged write (comment, effort, Force Pull) so
+    the next rerun re-reads Mongo instead of serving the pre-write
+    frame for the rest of the TTL.
+    """
+    load_data.clear(release, unique_key)
+    compute_analytics_counts.clear(release, unique_key)
+    for prefix in ("analytics_sig_", "analytics_cards_"):
+        st.session_state.pop(f"{prefix}{release}", None)
 
 
 def initialize_filter_state(release: str):
     """Initialize filter state for a release."""
     filter_key = f"filter_{release}"
     if filter_key not in st.session_state:
-        st.session_state[filter_key] = {
-            'type': None,  # 'status', 'assignee', 'effort'
-            'value': None,
-            'column': None
-        }
+        st.session_state[filter_key] = EMPTY_FILTER
 
 
 def set_filter(release: str, filter_type: str, value: str, column: str):
     """Set active filter for a release."""
     filter_key = f"filter_{release}"
-    current_filter = st.session_state[filter_key]
+    current_filter = st.session_state.get(filter_key, EMPTY_FILTER)
 
     # Toggle filter if clicking same value
-    if current_filter['type'] == filter_type and current_filter['value'] == value:
-        st.session_state[filter_key] = {
-            'type': None, 'value': None, 'column': None}
+    if current_filter.type == filter_type and current_filter.value == value:
+        st.session_state[filter_key] = EMPTY_FILTER
     else:
-        st.session_state[filter_key] = {
-            'type': filter_type,
-            'value': value,
-            'column': column
-        }
+        st.session_state[filter_key] = Filter(filter_type, value, column)
 
 
 def clear_filter(release: str):
     """Clear active filter for a release."""
-    filter_key = f"filter_{release}"
-    st.session_state[filter_key] = {
-        'type': None, 'value': None, 'column': None}
+    st.session_state[f"filter_{release}"] = EMPTY_FILTER
+
+
+def equals_mask(series: pd.Series, value) -> pd.Series:
+    """Build an equality mask, comparing int8 codes for categorical columns."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if value not in series.cat.categories:
+            return pd.Series(False, index=series.index)
+        code = series.cat.categories.get_loc(value)
+        return series.cat.codes == code
+    return series == value
 
 
 def apply_filter(df: pd.DataFrame, release: str) -> pd.DataFrame:
     """Apply active filter to DataFrame."""
-    filter_key = f"filter_{release}"
-    if filter_key not in st.session_state:
-        return df
-
-    active_filter = st.session_state[filter_key]
+    active_filter = st.session_state.get(f"filter_{release}", EMPTY_FILTER)
 
-    if active_filter['type'] and active_filter['value'] and active_filter['column']:
-        column = active_filter['column']
-        value = active_filter['value']
+    if active_filter.type and active_filter.value and active_filter.column:
+        column = active_filter.column
+        value = active_filter.value
 
         if column in df.columns:
-            # For assignee filter with non-implemented status
-            if active_filter['type'] == 'assignee':
-                return df[(df[column] == value) & (df['QA_status'] != 'Implemented')]
-            else:
-                return df[df[column] == value]
+            mask = equals_mask(df[column], value)
+            # For assignee filter with non-implemented status. One
+            # vectorized compare is effectively free, and recomputing
+            # it per render can't go stale when a refetch shifts
+            # statuses without changing the row count.
+            if active_filter.type == 'assignee':
+                mask &= ~equals_mask(df['QA_status'], 'Implemented')
+            return df[mask]
 
     return df
 
 
-def create_clickable_html_component(release: str, items: list, filter_type: str, column: str, active_filter: dict):
-    """Create HTML component with JavaScript to handle clicks directly."""
-
-    rows_html = []
-    for label, count, extra_info in items:
-        is_active = (active_filter['type'] ==
-                     filter_type and active_filter['value'] == label)
-        active_class = 'active' if is_active else ''
-        safe_label = label.replace("'", "\\'")
-
-        rows_html.append(f"""
-            <div class="clickable-metric {active_class}"
-                 onclick="handleMetricClick('{release}', '{filter_type}', '{safe_label}', '{column}')">
-                <div class="metric-label" style="font-size: 0.9rem; color: black; font-weight:800">{label}</div>
-                <div class="metric-count" style="font-size: 1.2rem; font-weight: 600; color: #1f77b4;">{count} {extra_info}</div>
-            </div>""")
-
-    html_content = f"""
-        <div class="metric-card">
-            {"".join(rows_html)}
-        </div>
-        <script>
-            function handleMetricClick(release, filterType, value, column) {{
-                // Send message to parent Streamlit window
-                window.parent.postMessage({{
-                    type: 'streamlit:setComponentValue',
-                    data: {{
-                        release: release,
-                        filterType: filterType,
-                        value: value,
-                        column: column
-                    }}
-                }}, '*');
-            }}
-        </script>
+def render_metric_buttons(release: str, items: list, filter_type: str, column: str, active_filter):
+    """Render one metric column as clickable filter buttons.
+
+    st.button reports clicks on the next rerun; components.html can't —
+    Streamlit only honors setComponentValue from bidirectional
+    components, so an iframe card's postMessage clicks are dropped.
     """
+    with st.container(height=320):
+        for idx, (label, count, extra_info) in enumerate(items, 1):
+            is_active = (active_filter.type == filter_type
+                         and active_filter.value == label)
+            button_label = f"{label}: {count} {extra_info}".rstrip()
+            if st.button(button_label, key=f"{filter_type}_{release}_{idx}",
+                         type="primary" if is_active else "secondary",
+                         use_container_width=True):
+                set_filter(release, filter_type, label, column)
+                st.rerun(scope="fragment")
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+def compute_analytics_counts(release: str, unique_key: int) -> dict:
+    """Compute every analytics count for a release in a single pass.
+
+    Returns a dict with 'status', 'assignee_nonimpl', 'assignee_impl' and
+    'effort' Series (None when the source column is missing) plus 'total'.
+    The QA_status comparison runs once and the mask is reused for both
+    assignee splits.
+    """
+    df = load_data(release=release, unique_key=unique_key)
+    counts = {
+        'total': len(df),
+        'status': None,
+        'assignee_nonimpl': None,
+        'assignee_impl': None,
+        'effort': None,
+    }
+    if df.empty:
+        return counts
+
+    if 'Feature_status' in df.columns:
+        counts['status'] = df['Feature_status'].value_counts()
+
+    if 'QA_assignee' in df.columns and 'QA_status' in df.columns:
+        impl_mask = df['QA_status'].values == 'Implemented'
+        assignees = df['QA_assignee']
+        counts['assignee_nonimpl'] = assignees[~impl_mask].value_counts()
+        counts['assignee_impl'] = assignees[impl_mask].value_counts()
 
-    return components.html(html_content, height=320)
+    if 'Effort' in df.columns:
+        # Effort is categorical, so this already comes back in
+        # EFFORT_SIZES order with zero counts included.
+        counts['effort'] = df['Effort'].value_counts(sort=False)
 
+    return counts
 
-def render_analytics_section(df: pd.DataFrame, release: str):
+
+def render_analytics_section(release: str, unique_key):
     """Render analytics section with metrics and charts."""
 
     initialize_filter_state(release)
@@ -273,139 +407,108 @@ def render_analytics_section(df: pd.DataFrame, release: str):
     active_filter = st.session_state[filter_key]
 
     # Show active filter badge and clear button
-    if active_filter['type']:
+    if active_filter.type:
         filter_col1, filter_col2 = st.columns([3, 1])
         with filter_col1:
             st.markdown(
-                f'<span class="filter-badge">🔍 Filtered by: {active_filter["value"]}</span>',
+                f'<span class="filter-badge">🔍 Filtered by: {active_filter.value}</span>',
                 unsafe_allow_html=True
             )
         with filter_col2:
             if st.button("✖ Clear Filter", key=f"clear_filter_{release}"):
                 clear_filter(release)
-                st.rerun()
+                st.rerun(scope="fragment")
         st.markdown("<br>", unsafe_allow_html=True)
 
     # Create three columns for the three metric cards
     col1, col2, col3, col4 = st.columns(4)
 
-    # Use original unfiltered data for all counts
-    original_df = load_data(
-        release=release, unique_key=get_rocm_unique_value(release))
-
-    # Status Analytics
-    with col1:
-        st.markdown("**Feature Status**")
-        with st.container(height=240):
-            if 'Feature_status' in df.columns:
-                status_counts = original_df['Feature_status'].value_counts()
-
-                for idx, (status, count) in enumerate(status_counts.items(), 1):
-                    percentage = (count / len(original_df) * 100)
-                    is_active = (
-                        active_filter['type'] == 'status' and active_filter['value'] == status)
-
-                    button_label = f"{status}: {count} ({percentage:.1f}%)"
-                    button_type = "primary" if is_active else "secondary"
-
-                    if st.button(button_label, key=f"status_{release}_{idx}",
-                                 type=button_type, use_container_width=True):
-                        set_filter(release, 'status', status, 'Feature_status')
-                        st.rerun()
-            else:
-                st.info("Feature_status column not found")
-
-    # Assignee Analytics
-    with col2:
-        st.markdown("**QA Assignee (Non-Implemented)**")
-        with st.container(height=240):
-            if 'QA_assignee' in df.columns and 'QA_status' in df.columns:
-                non_implemented = original_df[original_df['QA_status']
-                                              != 'Implemented']
-                assignee_counts = non_implemented['QA_assignee'].value_counts()
-
-                if len(assignee_counts) > 0:
-                    for idx, (assignee, count) in enumerate(assignee_counts.items(), 1):
-                        is_active = (
-                            active_filter['type'] == 'assignee' and active_filter['value'] == assignee)
-
-                        button_label = f"{assignee}: {count}"
-                        button_type = "primary" if is_active else "secondary"
-
-                        if st.button(button_label, key=f"assignee_{release}_{idx}",
-                                     type=button_type, use_container_width=True):
-                            set_filter(release, 'assignee',
-                                       assignee, 'QA_assignee')
-                            st.rerun()
-                else:
-                    st.success("✅ All tickets implemented!")
-            else:
-                st.info("Column not found")
-
-    # Effort Size Analytics
-    with col4:
-        st.markdown("**Effort Size**")
-        with st.container(height=240):
-            if 'Effort' in df.columns:
-                effort_counts = original_df['Effort'].value_counts()
-                effort_counts = effort_counts.reindex(
-                    EFFORT_SIZES, fill_value=0)
-
-                btn_idx = 1
-                for effort, count in effort_counts.items():
-                    if count > 0:
-                        percentage = (count / len(original_df) * 100)
-                        is_active = (
-                            active_filter['type'] == 'effort' and active_filter['value'] == effort)
-
-                        button_label = f"{effort}: {count} ({percentage:.1f}%)"
-                        button_type = "primary" if is_active else "secondary"
-
-                        if st.button(button_label, key=f"effort_{release}_{btn_idx}",
-                                     type=button_type, use_container_width=True):
-                            set_filter(release, 'effort', effort, 'Effort')
-                            st.rerun()
-                        btn_idx += 1
-
-                if btn_idx == 1:
-                    st.info("No effort data available")
-            else:
-                st.info("Effort column not found")
-
-    with col3:
-        st.markdown("**QA Assignee (Implemented)**")
-        # Remove the outer container - it's not needed
-        with st.container(height=240):  # scrolling is automatic when height is set
-            if 'QA_assignee' in df.columns and 'QA_status' in df.columns:
-                implemented = df[df['QA_status'] == 'Implemented']
-                assignee_counts = implemented['QA_assignee'].value_counts()
-
-                if len(assignee_counts) > 0:
-                    for idx, (assignee, count) in enumerate(assignee_counts.items(), 1):
-                        is_active = (active_filter['type'] == 'assignee_impl' and
-                                     active_filter['value'] == assignee)
-
-                        button_label = f"{assignee}: {count}"
-                        button_type = "primary" if is_active else "secondary"
-
-                        if st.button(button_label,
-                                     key=f"assignee_impl_{release}_{assignee}_{idx}",
-                                     type=button_type,
-                                     use_container_width=True):
-                            set_filter(release, 'assignee_impl',
-                                       assignee, 'QA_assignee')
-                            st.rerun()
-                else:
-                    st.success("✅ All tickets implemented!")
+    counts = compute_analytics_counts(release, unique_key)
+    total = counts['total']
+
+    # Rebuild the card row items only when the underlying counts
+    # change; keying on length alone would keep replaying stale items
+    # after a TTL refetch that shifted statuses without changing the
+    # row count. The count Series are small, so tupling them is cheap.
+    sig = (total,) + tuple(
+        None if counts[key] is None else tuple(counts[key].items())
+        for key in ('status', 'assignee_nonimpl', 'assignee_impl', 'effort'))
+    sig_key = f"analytics_sig_{release}"
+    cards_key = f"analytics_cards_{release}"
+
+    if st.session_state.get(sig_key) == sig and cards_key in st.session_state:
+        cards = st.session_state[cards_key]
+    else:
+        def card(items, filter_type, column):
+            return ('buttons', items, filter_type, column)
+
+        # Status Analytics
+        if counts['status'] is not None:
+            # Percentages come from one vectorized divide instead of a
+            # float division per card row.
+            pcts = (counts['status'] / total * 100).round(1).to_numpy()
+            items = [(status, count, f"({pct}%)")
+                     for (status, count), pct
+                     in zip(counts['status'].items(), pcts)]
+            status_card = card(items, 'status', 'Feature_status')
+        else:
+            status_card = ('info', "Feature_status column not found")
+
+        # Assignee Analytics
+        if counts['assignee_nonimpl'] is None:
+            nonimpl_card = ('info', "Column not found")
+        elif len(counts['assignee_nonimpl']) > 0:
+            items = [(assignee, count, "")
+                     for assignee, count in counts['assignee_nonimpl'].items()]
+            nonimpl_card = card(items, 'assignee', 'QA_assignee')
+        else:
+            nonimpl_card = ('success', "✅ All tickets implemented!")
+
+        if counts['assignee_impl'] is None:
+            impl_card = ('info', "Column not found")
+        elif len(counts['assignee_impl']) > 0:
+            items = [(assignee, count, "")
+                     for assignee, count in counts['assignee_impl'].items()]
+            impl_card = card(items, 'assignee_impl', 'QA_assignee')
+        else:
+            impl_card = ('success', "✅ All tickets implemented!")
+
+        # Effort Size Analytics
+        if counts['effort'] is not None:
+            pcts = (counts['effort'] / total * 100).round(1).to_numpy()
+            items = [(effort, count, f"({pct}%)")
+                     for (effort, count), pct
+                     in zip(counts['effort'].items(), pcts) if count > 0]
+            effort_card = (card(items, 'effort', 'Effort') if items
+                           else ('info', "No effort data available"))
+        else:
+            effort_card = ('info', "Effort column not found")
+
+        cards = [status_card, nonimpl_card, impl_card, effort_card]
+        st.session_state[sig_key] = sig
+        st.session_state[cards_key] = cards
+
+    titles = ("**Feature Status**", "**QA Assignee (Non-Implemented)**",
+              "**QA Assignee (Implemented)**", "**Effort Size**")
+    for column_slot, title, card_spec in zip(
+            (col1, col2, col3, col4), titles, cards):
+        with column_slot:
+            st.markdown(title)
+            if card_spec[0] == 'buttons':
+                _, items, filter_type, column = card_spec
+                render_metric_buttons(release, items, filter_type,
+                                      column, active_filter)
+            elif card_spec[0] == 'success':
+                st.success(card_spec[1])
             else:
-                st.info("Column not found")
+                st.info(card_spec[1])
 
     st.divider()
 
 
-def get_cell_renderers() -> Dict[str, JsCode]:
-    """Get JavaScript cell renderers for AgGrid."""
-    url_renderer = JsCode("""
+# Cell renderers are static JS; build the JsCode objects once at import
+# instead of re-parsing the strings on every render.
+_URL_RENDERER = JsCode("""
     class UrlCellRenderer {
         init(params) {
             this.eGui = document.createElement('span');
@@ -425,27 +528,32 @@ def get_cell_renderers() -> Dict[str, JsCode]:
     }
     """)
 
-    comments_renderer = JsCode("""
+_COMMENTS_RENDERER = JsCode("""
     class CommentsCellRenderer {
         init(params) {
             this.eGui = document.createElement('div');
-            this.eGui.innerHTML = params.value || '';
+            this.eGui.innerHTML = (params.value || []).slice().reverse().join('<br>');
             this.eGui.setAttribute('style', "white-space: normal; line-height: 1.5; font-weight: 700;");
         }
         getGui() { return this.eGui; }
     }
     """)
 
-    return {'url': url_renderer, 'comments': comments_renderer}
+_CELL_RENDERERS = {'url': _URL_RENDERER, 'comments': _COMMENTS_RENDERER}
 
 
+def get_cell_renderers() -> Dict[str, JsCode]:
+    """Get the module-level JavaScript cell renderers for AgGrid."""
+    return _CELL_RENDERERS
+
+
+# The options only depend on the frame's schema, so hash by
+# (columns, dtypes) instead of content: same release, same schema,
+# no from_dataframe dtype walk per rerun.
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={
+    pd.DataFrame: lambda d: (tuple(d.columns), tuple(map(str, d.dtypes)))})
 def configure_grid_options(df: pd.DataFrame) -> dict:
     """Configure AgGrid options."""
-    # Format comments
-    if "comments" in df.columns:
-        df["comments"] = df["comments"].apply(
-            lambda c: "<br>".join(reversed(c)))
-
     gb = GridOptionsBuilder.from_dataframe(df)
 
     # Default column configuration
@@ -500,9 +608,10 @@ def configure_grid_options(df: pd.DataFrame) -> dict:
     return gb.build()
 
 
-def get_custom_css() -> Dict[str, Any]:
-    """Get custom CSS for AgGrid."""
-    return {
+# AgGrid renders inside an iframe, so these rules cannot live in the
+# page-level <style> block; they are handed to the component once as a
+# module constant instead of being rebuilt per render.
+_CUSTOM_CSS: Dict[str, Any] = {
         ".ag-root-wrapper": {
             "border": "1px solid #e0e0e0",
             "border-radius": "8px",
@@ -530,6 +639,11 @@ def get_custom_css() -> Dict[str, Any]:
     }
 
 
+def get_custom_css() -> Dict[str, Any]:
+    """Get the module-level custom CSS for AgGrid."""
+    return _CUSTOM_CSS
+
+
 def render_header_section(release: str, df: pd.DataFrame, filtered_count: int) -> bool:
     """Render header section with controls. Returns True if force pull clicked."""
     header_cols = st.columns([2, 2, 2, 2])
@@ -538,13 +652,14 @@ def render_header_section(release: str, df: pd.DataFrame, filtered_count: int) -
         st.markdown(
             f'<div class="release-header">📦 Release: {release}</div>', unsafe_allow_html=True)
 
+    total = len(df)
     with header_cols[1]:
-        if filtered_count < len(df):
+        if filtered_count < total:
             st.html(
-                f"<div style='font-size: 22px;'>Showing: {filtered_count} / {len(df)} Tickets</div>")
+                f"<div style='font-size: 22px;'>Showing: {filtered_count} / {total} Tickets</div>")
         else:
             st.html(
-                f"<div style='font-size: 22px;'>Total Tickets: {len(df)}</div>")
+                f"<div style='font-size: 22px;'>Total Tickets: {total}</div>")
 
     with header_cols[2]:
         force_pull_btn = st.button(
@@ -567,15 +682,13 @@ def render_header_section(release: str, df: pd.DataFrame, filtered_count: int) -
     return force_pull_btn
 
 
-def handle_comment_submission(selected_row: Dict, release: str, new_comment: str) -> bool:
+def handle_comment_submission(selected_row: Dict, release: str, new_comment: str, ticket_id: str) -> bool:
     """Handle comment submission. Returns True if successful."""
     if not new_comment.strip():
         st.warning("⚠️ Please enter a comment before submitting.")
         return False
 
     try:
-        ticket_id = get_ticket_id(
-            selected_row['Feature ID'], selected_row['QA_task'])
         ack = comments_addition(
             ticket_id=ticket_id,
             comment=new_comment,
@@ -591,14 +704,12 @@ def handle_comment_submission(selected_row: Dict, release: str, new_comment: str
         return False
 
 
-def handle_effort_update(selected_row: Dict, release: str, new_effort: str) -> bool:
+def handle_effort_update(selected_row: Dict, release: str, new_effort: str, ticket_id: str) -> bool:
     """Handle effort update. Returns True if successful."""
     if new_effort == selected_row['Effort']:
         return False
 
     try:
-        ticket_id = get_ticket_id(
-            selected_row['Feature ID'], selected_row['QA_task'])
         ack = update_effort(
             ticket_id=ticket_id,
             effort=new_effort,
@@ -610,23 +721,34 @@ def handle_effort_update(selected_row: Dict, release: str, new_effort: str) -> b
         return False
 
 
-def show_row_details_dialog(selected_row: Dict, release: str):
+def show_row_details_dialog(selected_row: Dict, release: str, unique_key):
     """Show dialog with row details and edit options."""
     dialog_key = f"show_dialog_{selected_row['Feature ID']}_{release}"
-    if dialog_key not in st.session_state:
-        st.session_state[dialog_key] = True
 
-    if dialog_key in st.session_state and not st.session_state[dialog_key] and selected_row["comments"] != "":
+    # Re-open only when the grid selection actually changed; reruns with
+    # the same row selected (e.g. after submitting a comment) keep the
+    # dismissed state instead of popping the dialog back up.
+    last_sel_key = f"last_sel_{release}"
+    if st.session_state.get(last_sel_key) != selected_row['Feature ID']:
+        st.session_state[last_sel_key] = selected_row['Feature ID']
         st.session_state[dialog_key] = True
+    elif dialog_key not in st.session_state:
+        st.session_state[dialog_key] = True
+
+    # Derived fresh from the selected row each run: a Force Pull can
+    # swap a feature's QA task, which changes the document _id, and a
+    # memoized id would silently target the old document.
+    ticket_id = get_ticket_id(
+        selected_row['Feature ID'], selected_row['QA_task'])
 
     if st.session_state[dialog_key]:
         @st.dialog(f"{selected_row['Feature ID']} comments")
         def show_details():
             st.write("### Comments")
-            comments = selected_row['comments'].split(
-                "<br>") if selected_row['comments'] else []
-            if comments and comments[0]:
-                for comment in comments:
+            comments = selected_row['comments']
+            if len(comments) > 0:
+                # Newest first, matching the grid renderer.
+                for comment in comments[::-1]:
                     st.markdown(f"- {comment}")
             else:
                 st.write("No comments found.")
@@ -641,14 +763,17 @@ def show_row_details_dialog(selected_row: Dict, release: str):
             current_effort = st.selectbox(
                 "Size of Ticket",
                 EFFORT_SIZES,
-                index=EFFORT_SIZES.index(st.session_state[effort_key]),
+                index=_EFFORT_INDEX[st.session_state[effort_key]],
                 key=f"select_{effort_key}",
                 help="Select the effort type"
             )
 
             if current_effort != st.session_state[effort_key]:
-                if handle_effort_update(selected_row, release, current_effort):
+                if handle_effort_update(selected_row, release, current_effort, ticket_id):
                     st.session_state[effort_key] = current_effort
+                    # Drop the cached frame so the grid shows the new
+                    # effort instead of the pre-write data.
+                    invalidate_release_data(release, unique_key)
                     st.success("✅ Effort updated!")
 
             st.divider()
@@ -661,39 +786,104 @@ def show_row_details_dialog(selected_row: Dict, release: str):
             )
 
             if st.button("Submit Comment", key=f"submit_{selected_row['Feature ID']}_{release}", type="primary"):
-                if handle_comment_submission(selected_row, release, new_comment):
+                if handle_comment_submission(selected_row, release, new_comment, ticket_id):
+                    invalidate_release_data(release, unique_key)
                     st.session_state[dialog_key] = False
                     st.rerun()
 
         show_details()
 
 
-def render_release_section(release: str):
-    """Render a single release section."""
-    unique_key = get_rocm_unique_value(release)
-    loaded_df = load_data(release=release, unique_key=unique_key)
+def render_native_table(df: pd.DataFrame, release: str, unique_key):
+    """Render tickets with st.dataframe (USE_NATIVE_TABLE path).
 
-    # Load data
-    force_pull = False
-    if not loaded_df.empty:
-        # Render analytics first (with unfiltered data for counts)
-        render_analytics_section(loaded_df, release)
+    Ticket-key columns become LinkColumns pointing at JIRA; a single-row
+    selection opens the same details dialog as the AgGrid path.
+    """
+    display_df = df.copy()
+    link_columns = {
+        'Feature ID': 'Feature Task Key',
+        'QA_task': 'QA Task',
+        'Auto_task': 'Auto Task',
+        'TMS_task': 'TMS Task',
+    }
+    column_config = {}
+    for col, header in link_columns.items():
+        if col in display_df.columns:
+            # pd.isna first: Arrow-backed columns hold pd.NA, whose
+            # truthiness raises rather than reading as falsy.
+            display_df[col] = display_df[col].map(
+                lambda v: None if pd.isna(v) or not v or v == 'NA'
+                else JIRA_BASE_URL + v)
+            column_config[col] = st.column_config.LinkColumn(
+                header, display_text=JIRA_BASE_URL + r'(.+)')
+    if 'comments' in display_df.columns:
+        display_df['comments'] = ["\n".join(c[::-1]) if c is not None and len(c) else ""
+                                  for c in display_df['comments'].values]
+        column_config['comments'] = st.column_config.TextColumn(
+            'comments', width='large')
+
+    event = st.dataframe(
+        display_df,
+        column_config=column_config,
+        height=650,
+        use_container_width=True,
+        on_select='rerun',
+        selection_mode='single-row',
+        key=f"native_grid_{release}"
+    )
 
-        # Apply filter to get display data
-        filtered_df = apply_filter(loaded_df.copy(), release)
+    if event.selection and event.selection['rows']:
+        row = df.iloc[event.selection['rows'][0]]
+        selected_row = {
+            col: row[col]
+            for col in ('Feature ID', 'QA_task', 'Effort', 'comments')
+            if col in df.columns
+        }
+        show_row_details_dialog(selected_row, release, unique_key)
 
-        # Render header
-        force_pull = render_header_section(
-            release, loaded_df, len(filtered_df))
 
-    if force_pull:
+@st.fragment
+def render_release_section(release: str, unique_key):
+    """Render a single release section, scoped so interactions inside
+    one release only rerun that release's fragment."""
+    # Handle a Force Pull click before loading anything. The button's
+    # session_state entry is readable at the top of the rerun, so the
+    # regular load isn't computed first and thrown away.
+    if st.session_state.get(f"force_pull_{release}"):
         with st.spinner(f"⏳ Fetching latest data for {release}..."):
-            df = load_data_no_cache(release=release, unique_key=unique_key)
+            refreshed = load_data_no_cache(
+                release=release, unique_key=unique_key)
+        if not refreshed.empty:
             st.success(f"✅ Data refreshed for {release}!")
-            clear_filter(release)
-            st.rerun()
+        clear_filter(release)
+        st.session_state.pop(f"analytics_sig_{release}", None)
+        st.session_state.pop(f"analytics_cards_{release}", None)
+
+    with st.spinner(f"⏳ Loading data for {release}..."):
+        try:
+            loaded_df = load_data(release=release, unique_key=unique_key)
+        except Exception:  # pylint: disable=broad-except
+            # Warn here rather than inside the cached function so a
+            # transient failure isn't memoized for the whole TTL.
+            st.warning(f"⚠️ No Tickets Found for {release}")
+            loaded_df = pd.DataFrame()
+
+    if not loaded_df.empty:
+        # Render analytics first (counts come from the cached
+        # unfiltered frame via compute_analytics_counts)
+        render_analytics_section(release, unique_key)
+
+        # Apply filter to get display data (boolean indexing already
+        # returns a new frame, so no defensive copy is needed)
+        filtered_df = apply_filter(loaded_df, release)
+
+        # Render header (the Force Pull click itself is consumed at the
+        # top of the fragment via session_state)
+        render_header_section(release, loaded_df, len(filtered_df))
+        df = filtered_df
     else:
-        df = filtered_df if not loaded_df.empty else loaded_df
+        df = loaded_df
 
     # Check if empty
     if df.empty:
@@ -701,32 +891,52 @@ def render_release_section(release: str):
         st.markdown('</div>', unsafe_allow_html=True)
         return
 
-    # Process DataFrame
-    if "_id" in df.columns:
-        df["_id"] = df["_id"].astype(str).str.split("|").str[0]
-        df = df.rename(columns={"_id": "Feature ID"})
+    # Keep the grid payload bounded; the Download CSV button in the
+    # header still exports everything.
+    if len(df) > MAX_GRID_ROWS:
+        st.caption(
+            f"Showing the first {MAX_GRID_ROWS:,} of {len(df):,} rows — "
+            "use Download CSV for the full data."
+        )
+        df = df.iloc[:MAX_GRID_ROWS]
 
     try:
+        if USE_NATIVE_TABLE:
+            render_native_table(df, release, unique_key)
+            st.markdown('</div>', unsafe_allow_html=True)
+            return
+
         # Configure and display grid
         grid_options = configure_grid_options(df)
         grid_response = AgGrid(
             df,
             gridOptions=grid_options,
             enable_enterprise_modules='enterprise+AgCharts',
-            fit_columns_on_grid_load=True,
+            # Autosizing measures every cell client-side; skip it once
+            # the frame is big enough for that to stall first paint.
+            fit_columns_on_grid_load=len(df) < 500,
             height=650,
             update_mode=GridUpdateMode.NO_UPDATE,
-            data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
+            # The frame is already known server-side; only selections are
+            # consumed, so don't ship the filtered/sorted rows back.
+            data_return_mode=DataReturnMode.AS_INPUT,
             theme="alpine",
-            custom_css=get_custom_css(),
+            custom_css=_CUSTOM_CSS,
             allow_unsafe_jscode=True,
             key=f"grid_{release}"
         )
 
         # Handle selected rows
-        if grid_response['selected_rows'] is not None and len(grid_response['selected_rows']) > 0:
-            selected_row = grid_response['selected_rows'].iloc[0].to_dict()
-            show_row_details_dialog(selected_row, release)
+        selected = grid_response['selected_rows']
+        if selected is not None and len(selected) > 0:
+            # Pull only the fields the dialog reads instead of
+            # materializing the whole wide row as a Series + dict.
+            selected_row = {
+                col: selected[col].iat[0]
+                for col in ('Feature ID', 'QA_task', 'Effort', 'comments')
+                if col in selected.columns
+            }
+            show_row_details_dialog(selected_row, release, unique_key)
 
     except Exception as e:  # pylint: disable=broad-except
         st.error(f"❌ Error rendering grid: {str(e)}")
@@ -755,9 +965,32 @@ def main():
 
     st.divider()
 
+    # Resolve every unique key in one lookup instead of once per section.
+    unique_values = get_rocm_unique_values()
+
+    # Warm the load_data cache for every selected release in parallel.
+    # The fetches are I/O bound, so overlapping them costs roughly one
+    # round-trip instead of one per release; the fragments below then
+    # hit the populated cache.
+    if len(selected_releases) > 1:
+        with ThreadPoolExecutor(
+                max_workers=min(8, len(selected_releases))) as executor:
+            futures = [
+                executor.submit(load_data, release=release,
+                                unique_key=unique_values.get(release))
+                for release in selected_releases
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:  # pylint: disable=broad-except
+                    # The fragment retries the load and shows the
+                    # warning; the warm-up just skips this release.
+                    pass
+
     # Display each release
     for release in selected_releases:
-        render_release_section(release)
+        render_release_section(release, unique_values.get(release))
 
 
 if __name__ == "__main__":
@@ -150,6 +150,11 @@ def get_rocm_unique_value(version: str) -> int:
     return rocm_mapping.get(version, None)
 
 
+def get_rocm_unique_values() -> dict:
+    """Return the full version -> value mapping in a single lookup."""
+    return rocm_mapping
+
+
 def get_rocm_versions():
     """Return a list of all ROCm version strings."""
     return list(rocm_mapping.keys())
@@ -1,6 +1,6 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
 
-import schedule
+from apscheduler.schedulers.blocking import BlockingScheduler
 
 from packages.database.schema import Database
 from packages.balancer import force_refetch_and_update
@@ -9,18 +9,29 @@ from common import get_rocm_unique_value
 db = Database('7.2')
 
 
+def refresh_collection(name):
+    """Refetch one collection, isolating failures from the rest."""
+    try:
+        force_refetch_and_update(
+            rocm_version=name, unique_key=str(get_rocm_unique_value(name)))
+    except Exception as e:  # pylint: disable=broad-except
+        print(f"Error refreshing {name}: {e}")
+
+
 def job():
     """Execute scheduled job to refetch and update all collections."""
     arr = db.get_all_collections()
     print("Refetching and updating all collections...")
-    for i in arr:
-        force_refetch_and_update(
-            rocm_version=i, unique_key=str(get_rocm_unique_value(i)))
-
-
-# Run every second
-schedule.every(30).minutes.do(job)
-
-while True:
-    schedule.run_pending()
-    time.sleep(1)
+    # Each refresh is JIRA/Mongo I/O bound, so run them concurrently
+    # instead of paying the latency once per collection.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(refresh_collection, arr))
+
+
+# BlockingScheduler sleeps until the next deadline instead of waking
+# every second to poll; max_instances=1 stops overlap if a sweep runs
+# long and coalesce merges runs missed while suspended.
+scheduler = BlockingScheduler()
+scheduler.add_job(job, 'interval', minutes=30,
+                  max_instances=1, coalesce=True)
+scheduler.start()
@@ -4,13 +4,32 @@ This module provides functionality for managing and synchronizing tickets betwee
 JIRA and a local database. It handles ticket fetching, updating, insertion,
 deletion, comments management, and effort tracking for ROCm version tickets.
 """
-import json
+from functools import lru_cache
 
 import pandas as pd
 
 from packages.database.schema import Database  # pylint: disable=import-error
 from packages.ticketfetchers.ticket_fetcher_optimized import TicketFetch  # pylint: disable=import-error
 
+# Fields refreshed from JIRA on every sync. comments and Effort are
+# edited locally, so the bulk upsert only writes them on first insert.
+UPDATE_FIELDS = (
+    'Feature_status', 'Feature_summary',
+    'QA_task', 'QA_status', 'QA_assignee', 'QA_labels',
+    'Auto_task', 'Auto_status',
+    'TMS_task', 'TMS_status',
+)
+
+# Keep bulk_write batches bounded so a single huge payload doesn't
+# blow past Mongo's message size limits.
+BULK_CHUNK_SIZE = 1000
+
+
+@lru_cache(maxsize=16)
+def _db(rocm_version: str) -> Database:
+    """One Database wrapper per release, reused across calls."""
+    return Database(rocm_version)
+
 
 def comments_addition(rocm_version: str, ticket_id, comment):
     """Add a comment to a ticket in the database.
@@ -23,7 +42,7 @@ def comments_addition(rocm_version: str, ticket_id, comment):
     Returns:
         bool: True if comment was added successfully, False otherwise
     """
-    db = Database(rocm_version)
+    db = _db(rocm_version)
     comment_obj = {
         "date": pd.Timestamp.now().strftime("%-d-%b"),
         "comment": comment
@@ -42,12 +61,12 @@ def get_comments(rocm_version: str, ticket_id):
     Returns:
         list: List of comments for the ticket
     """
-    db = Database(rocm_version)
+    db = _db(rocm_version)
     result = db.find(ticket_id)
     return result["comments"]
 
 
-def force_refetch_and_update(rocm_version: str, unique_key: str):
+def force_refetch_and_update(rocm_version: str, unique_key: str, data=None):
     """Force refetch tickets from JIRA and update the database.
 
     Fetches latest ticket data, updates existing tickets, inserts new ones,
@@ -56,11 +75,14 @@ def force_refetch_and_update(rocm_version: str, unique_key: str):
     Args:
         rocm_version: The ROCm version identifier
         unique_key: Unique key for the ticket fetch operation
+        data: Optional pre-fetched ticket data (list of dicts). When
+            provided, the JIRA fetch is skipped so callers that already
+            fetched don't pay for a second round-trip.
 
     Returns:
         bool: True if any updates/inserts/deletes occurred, False otherwise
     """
-    db = Database(rocm_version)
+    db = _db(rocm_version)
 
     # Check if collection exists
     if not db.iscollection_present():
@@ -70,10 +92,11 @@ def force_refetch_and_update(rocm_version: str, unique_key: str):
 
     print("Collection present")
 
-    # Fetch tickets
-    tf = TicketFetch(rocm_version=rocm_version, unique_key=unique_key,
-                     verbose=True, is_json=True, max_workers=6)
-    data = tf.fetch_tickets()
+    # Fetch tickets unless the caller already did
+    if data is None:
+        tf = TicketFetch(rocm_version=rocm_version, unique_key=unique_key,
+                         verbose=True, is_json=True, max_workers=6)
+        data = tf.fetch_tickets()
 
     # Validate data
     if not data or len(data) == 0:
@@ -81,22 +104,17 @@ def force_refetch_and_update(rocm_version: str, unique_key: str):
         return False
     # print(f"Fetched {len(data)} tickets")
 
-    # Parse JSON if needed
-    try:
-        tickets = json.loads(data) if isinstance(data, str) else data
-        print("tickets My", tickets)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON: {e}")
-        return False
+    # The fetcher hands back the rows list directly; no JSON round-trip
+    tickets = data
 
     # Create a set of fetched ticket IDs for quick lookup
     fetched_ticket_ids = {ticket.get("_id")
                           for ticket in tickets if ticket.get("_id")}
     print(f"Fetched ticket IDs: {len(fetched_ticket_ids)}")
 
-    # Get all existing tickets from database
-    existing_tickets = db.find_all()  # Assuming this method exists
-    # print(existing_tickets)
+    # Get existing ticket IDs from database, projecting _id only so
+    # full documents aren't shipped just to build the set.
+    existing_tickets = db.find_all(projection=('_id',))
     existing_ticket_ids = {ticket.get(
         "_id") for ticket in existing_tickets if ticket.get("_id")}
     print(f"Existing ticket IDs in DB: {len(existing_ticket_ids)}")
@@ -104,69 +122,31 @@ def force_refetch_and_update(rocm_version: str, unique_key: str):
         f"Tickets to delete: {len(existing_ticket_ids - fetched_ticket_ids)}")
     # Find tickets to delete (present in DB but not in fetched data)
     tickets_to_delete = existing_ticket_ids - fetched_ticket_ids
-    # Update/insert tickets
-    updated_count = 0
-    inserted_count = 0
+    # Upsert every fetched ticket via bulk_write instead of a
+    # find + update/insert round-trip per ticket.
+    updated_count = len(fetched_ticket_ids & existing_ticket_ids)
+    inserted_count = len(fetched_ticket_ids - existing_ticket_ids)
     deleted_count = 0
     error_count = 0
-    for ticket in tickets:
+    valid_tickets = [t for t in tickets if t.get("_id")]
+    for start in range(0, len(valid_tickets), BULK_CHUNK_SIZE):
+        chunk = valid_tickets[start:start + BULK_CHUNK_SIZE]
         try:
-            ticket_id = ticket.get("_id")
-            if not ticket_id:
-                print(f"Warning: Ticket missing _id: {ticket}")
-                continue
-            # Check if ticket exists
-            existing = db.find(ticket_id)
-            if existing:
-                # Update existing ticket
-                update_data = {
-                    'Feature_status': ticket.get('Feature_status'),
-                    'Feature_summary': ticket.get('Feature_summary'),
-                    'QA_task': ticket.get("QA_task"),
-                    'QA_status': ticket.get('QA_status'),
-                    'QA_assignee': ticket.get('QA_assignee'),
-                    'QA_labels': ticket.get("QA_labels"),
-                    'Auto_task': ticket.get("Auto_task"),
-                    'Auto_status': ticket.get("Auto_status"),
-                    'TMS_task': ticket.get("TMS_task"),
-                    'TMS_status': ticket.get("TMS_status"),
-                }
-                result = db.update(ticket_id, update_data)
-                if result:
-                    updated_count += 1
-                    print(f"Updated ticket: {ticket_id}")
-                else:
-                    print(f"Failed to update ticket: {ticket_id}")
-                    error_count += 1
-            else:
-                # Insert new ticket
-                print(f"Inserting new ticket: {ticket_id}")
-                result = db.insert([ticket])
-                if result:
-                    inserted_count += 1
-                else:
-                    print(f"Failed to insert ticket: {ticket_id}")
-                    error_count += 1
+            if not db.bulk_upsert(chunk, update_fields=UPDATE_FIELDS):
+                print(f"Bulk upsert not acknowledged for {len(chunk)} tickets")
+                error_count += len(chunk)
         except Exception as e:  # pylint: disable=broad-except
-            print(
-                f"Error processing ticket {ticket.get('_id', 'unknown')}: {e}")
-            error_count += 1
+            print(f"Error bulk upserting tickets: {e}")
+            error_count += len(chunk)
     # Delete tickets that are no longer in the fetched data
     if tickets_to_delete:
         print(
             f"\nDeleting {len(tickets_to_delete)} tickets not present in fetched data...")
-        for ticket_id in tickets_to_delete:
-            try:
-                result = db.delete(ticket_id)  # Assuming this method exists
-                if result:
-                    deleted_count += 1
-                    print(f"Deleted ticket: {ticket_id}")
-                else:
-                    print(f"Failed to delete ticket: {ticket_id}")
-                    error_count += 1
-            except Exception as e:  # pylint: disable=broad-except
-                print(f"Error deleting ticket {ticket_id}: {e}")
-                error_count += 1
+        try:
+            deleted_count = db.delete_ids(tickets_to_delete)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Error deleting tickets: {e}")
+            error_count += len(tickets_to_delete)
     print("\nSummary:")
     print(f"  Updated: {updated_count}")
     print(f"  Inserted: {inserted_count}")
@@ -186,11 +166,11 @@ def update_effort(rocm_version: str, ticket_id: str, effort: str):
     Returns:
         bool: True if effort was updated successfully, False otherwise
     """
-    db = Database(rocm_version)
+    db = _db(rocm_version)
     return db.update_effort(ticket_id, effort)
 
 
-def balance(rocm_version: str, unique_key: str):
+def balance(rocm_version: str, unique_key: str, columns=None):
     """Balance and sync tickets between JIRA and database.
 
     Checks if database collection exists. If yes, returns existing data.
@@ -199,24 +179,25 @@ def balance(rocm_version: str, unique_key: str):
     Args:
         rocm_version: The ROCm version identifier
         unique_key: Unique key for the ticket fetch operation
+        columns: Optional iterable of field names to project; limits
+            what the database returns to what the caller renders.
 
     Returns:
         list: List of all tickets, or False if operation fails
     """
-    db = Database(rocm_version)
+    db = _db(rocm_version)
     if db.iscollection_present():
-        return list(db.find_all())
+        return list(db.find_all(projection=columns))
     else:
         print("Collection not present, fetching tickets...")
         tf = TicketFetch(rocm_version=rocm_version, unique_key=unique_key,
                          verbose=True, is_json=True, max_workers=6)
 
         try:
-            data = tf.fetch_tickets()
-            tickets = json.loads(data) if isinstance(data, str) else data
+            tickets = tf.fetch_tickets()
 
             if db.insert(tickets):
-                return list(db.find_all())
+                return list(db.find_all(projection=columns))
             else:
                 print("Failed to insert tickets")
                 return False
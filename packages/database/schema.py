@@ -1,5 +1,19 @@
 # schema of mongodb database
-from pymongo import MongoClient
+from functools import lru_cache
+
+from pymongo import MongoClient, UpdateOne
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Return the process-wide MongoClient.
+
+    Constructing a client pays a TCP handshake plus topology discovery
+    every time; the driver pools connections internally, so a single
+    shared instance serves every Database wrapper in the process.
+    """
+    return MongoClient("mongodb://10.130.163.217:27017",
+                       maxPoolSize=50, minPoolSize=5)
 
 
 class Database:
@@ -14,7 +28,7 @@ class Database:
         Args:
             collection: Name of the MongoDB collection to use.
         """
-        self.client = MongoClient("mongodb://10.130.163.217:27017")
+        self.client = _get_client()
         self.db = self.client["tickets"]
         self.collection = self.db[collection]
 
@@ -43,7 +57,43 @@ class Database:
         Returns:
             bool: True if insertion was acknowledged.
         """
-        return self.collection.insert_many(data).acknowledged
+        # Unordered writes let the server apply documents in parallel
+        # and keep going past individual failures.
+        return self.collection.insert_many(data, ordered=False).acknowledged
+
+    def bulk_upsert(self, docs, update_fields=None):
+        """Upsert many documents in one bulk_write round trip.
+
+        Args:
+            docs: List of documents, each carrying an _id.
+            update_fields: Optional iterable of field names to $set on
+                existing documents. Remaining fields go into
+                $setOnInsert, so locally-edited fields (comments,
+                Effort) survive a refresh. When None, the whole
+                document is $set.
+
+        Returns:
+            bool: True if the bulk write was acknowledged.
+        """
+        ops = []
+        for doc in docs:
+            doc_id = doc.get("_id")
+            if not doc_id:
+                continue
+            if update_fields is None:
+                update = {"$set": doc}
+            else:
+                # Skip fields the fetch didn't supply rather than
+                # writing $set: null over existing values.
+                update = {
+                    "$set": {f: doc[f] for f in update_fields if f in doc},
+                    "$setOnInsert": {f: v for f, v in doc.items()
+                                     if f != "_id" and f not in update_fields},
+                }
+            ops.append(UpdateOne({"_id": doc_id}, update, upsert=True))
+        if not ops:
+            return False
+        return self.collection.bulk_write(ops, ordered=False).acknowledged
 
     def find(self, id):
         """Find a single document by ID.
@@ -56,13 +106,21 @@ class Database:
         """
         return self.collection.find_one({"_id": id})
 
-    def find_all(self):
+    def find_all(self, projection=None):
         """Retrieve all documents from the collection.
 
+        Args:
+            projection: Optional iterable of field names; when given,
+                only those fields (plus _id) are returned per document.
+
         Returns:
             Cursor to iterate over all documents.
         """
-        return self.collection.find()
+        # Larger batches cut per-batch round-trips on big result sets.
+        if projection is not None:
+            return self.collection.find(
+                {}, dict.fromkeys(projection, 1)).batch_size(500)
+        return self.collection.find().batch_size(500)
 
     def delete(self, id):
         """Delete a single document by ID.
@@ -75,6 +133,18 @@ class Database:
         """
         return self.collection.delete_one({"_id": id}).acknowledged
 
+    def delete_ids(self, ids):
+        """Delete many documents by ID in one round trip.
+
+        Args:
+            ids: Iterable of document IDs to delete.
+
+        Returns:
+            int: Number of documents deleted.
+        """
+        return self.collection.delete_many(
+            {"_id": {"$in": list(ids)}}).deleted_count
+
     def delete_all(self):
         """Delete all documents from the collection.
 
@@ -134,7 +204,12 @@ class Database:
         return self.collection.update_one({"_id": id}, {"$push": {"comments": data}}).acknowledged
 
     def close(self):
-        """Close the MongoDB client connection."""
+        """Close the shared MongoDB client connection.
+
+        The client is process-wide, so this tears down pooling for every
+        Database instance — only call it on shutdown.
+        """
+        _get_client.cache_clear()
         self.client.close()
 
 # arr = ['7.2.1', '7.1', '7.1.1', '8.0.0', '7.0']
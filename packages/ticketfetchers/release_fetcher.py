@@ -1,13 +1,26 @@
 import requests as rq
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated calls reuse one keep-alive connection.
+_session = rq.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# Successful result is kept for the life of the process; errors are
+# not cached so the next call retries.
+_cached_releases = None
+
 
 def get_releases():
+    global _cached_releases
+    if _cached_releases is not None:
+        return _cached_releases
     try:
-        response  = rq.get("http://api.rastra-rts.amd.com/releases?issue_type=feature")
+        response = _session.get(
+            "http://api.rastra-rts.amd.com/releases?issue_type=feature")
         print(response.status_code)
         rocm_releases = response.json()
         releases_labels = [i["value"] for i in rocm_releases]
+        _cached_releases = releases_labels
         return releases_labels
     except rq.exceptions.RequestException as e:
         return {"error": str(e)}
-    
-get_releases()
\ No newline at end of file
@@ -74,27 +74,61 @@ class TicketFetch:
 
         return QA_committed_feature_tasks
         
+    def get_linked_task_keys(self, feature_task):
+        keys = []
+        for link in feature_task.fields.issuelinks:
+            linked_issue = getattr(link, 'inwardIssue', None) or getattr(link, 'outwardIssue', None)
+
+            if link.raw['type'].get('inward') == 'Comprised of Task' and linked_issue:
+                if linked_issue.fields.issuetype.name == 'Task':
+                    keys.append(linked_issue.key)
+        return keys
+
+    def bulk_fetch_issues(self, keys, chunk_size=100):
+        # One `key in (...)` search per 100 keys instead of one
+        # auth.issue() round-trip per linked task.
+        key_to_issue = {}
+        keys = list(keys)
+        fields = "key,status,summary,assignee,labels,issuelinks,issuetype,customfield_14308"
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            issues = self.auth.search_issues(
+                f"key in ({','.join(chunk)})",
+                maxResults=len(chunk),
+                validate_query=False,
+                fields=fields)
+            for issue in issues:
+                key_to_issue[issue.key] = issue
+        return key_to_issue
+
     def fetch_tickets(self):
         feature_tasks = self.auth.search_issues(self.jql_query, maxResults=1000)
         QA_committed_feature_tasks = self.get_qa_committed_task(feature_tasks)
         required_data = []
 
-        for index, feature_task in enumerate(QA_committed_feature_tasks):
-            qa_task_available = False
+        feature_to_keys = {}
+        all_keys = set()
+        for feature_task in QA_committed_feature_tasks:
+            keys = self.get_linked_task_keys(feature_task)
+            feature_to_keys[feature_task.key] = keys
+            all_keys.update(keys)
 
-            for link in feature_task.fields.issuelinks:
-                linked_issue = getattr(link, 'inwardIssue', None) or getattr(link, 'outwardIssue', None)
+        linked_issues = self.bulk_fetch_issues(all_keys)
 
-                if link.raw['type'].get('inward') == 'Comprised of Task' and linked_issue:
-                    if linked_issue.fields.issuetype.name == 'Task':
-                        task_info = self.auth.issue(linked_issue.key)
-                        triage_field = getattr(task_info.fields, 'customfield_14308', None)
+        for index, feature_task in enumerate(QA_committed_feature_tasks):
+            qa_task_available = False
 
-                        if triage_field and triage_field[0] == '73317' and task_info.fields.status.name != 'Rejected':
-                            qa_task_available = True
-                            task_related_data = self.get_task_details(feature_task, task_info)
-                            required_data.append(task_related_data)
-                            print(f"Details updated for {feature_task.key}  ({index+1}/{len(QA_committed_feature_tasks)})\n")
+            for key in feature_to_keys[feature_task.key]:
+                task_info = linked_issues.get(key)
+                if task_info is None:
+                    continue
+                triage_field = getattr(task_info.fields, 'customfield_14308', None)
+
+                if triage_field and triage_field[0] == '73317' and task_info.fields.status.name != 'Rejected':
+                    qa_task_available = True
+                    task_related_data = self.get_task_details(feature_task, task_info)
+                    required_data.append(task_related_data)
+                    print(f"Details updated for {feature_task.key}  ({index+1}/{len(QA_committed_feature_tasks)})\n")
 
             if not qa_task_available:
                 task_related_data = self.get_task_details(feature_task)
@@ -8,12 +8,62 @@ from dotenv import load_dotenv
 import os
 load_dotenv()
 from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
 
 
 # -----------------------------
 # Configuration (edit as needed)
 # -----------------------------
-JIRA_SERVER = "https://ontrack-internal.amd.com/" 
+JIRA_SERVER = "https://ontrack-internal.amd.com/"
+
+# One pooled adapter shared by every JIRA session in the process. Each
+# fetcher instance mounts it, so parallel chunk fetches (and the cron
+# sweep's many fetchers) reuse warm keep-alive connections instead of
+# opening a fresh pool per instance.
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # allowed_methods=None retries every verb: the searches POST to
+    # /rest/api/2/search (urllib3's default method list excludes POST,
+    # which would leave them unretried), and those POSTs are read-only
+    # queries, safe to replay on a 429/5xx.
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      allowed_methods=None,
+                      status_forcelist=(429, 500, 502, 503, 504)),
+)
+
+
+# Compiled once at import; every TicketFetch instance shares it.
+_QA_COMMITTED_PATTERN = re.compile(r'#teams_committed.*?QA', re.IGNORECASE)
+
+
+class _Obj:
+    """Read-only attribute view over a JSON dict (recursive).
+
+    jira-python hands back Issue proxies with attribute access; the raw
+    REST payload is plain dicts. This keeps the downstream
+    getattr(issue.fields.status, 'name', ...) style working and exposes
+    the original dict as .raw for the link-type checks.
+    """
+    __slots__ = ('raw',)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __getattr__(self, name):
+        try:
+            value = self.raw[name]
+        except (KeyError, TypeError):
+            raise AttributeError(name) from None
+        return _wrap(value)
+
+
+def _wrap(value):
+    if isinstance(value, dict):
+        return _Obj(value)
+    if isinstance(value, list):
+        return [_wrap(v) for v in value]
+    return value
 
 
 class TicketFetch:
@@ -27,8 +77,10 @@ class TicketFetch:
 
     # --- Tunables ---
     MAX_RESULTS = 1000                   # upper bound for initial feature fetch
+    PAGE_SIZE = 500                      # rows per raw /search POST (vs 50 via the wrapper)
     CHUNK_SIZE = 100                     # keys per JQL chunk (keep below URL length limits)
     MAX_WORKERS = 6                      # adjust based on your Jira rate limits
+    MAX_WORKERS_CAP = 16                 # hard ceiling to stay under rate limits
     BACKOFF_BASE_SEC = 1.5               # exponential backoff base
     BACKOFF_MAX_RETRIES = 4              # retries for transient failures
 
@@ -45,21 +97,24 @@ class TicketFetch:
         self.verbose = verbose
         self.is_json = is_json
         if max_workers:
-            self.MAX_WORKERS = max_workers
+            self.MAX_WORKERS = min(max_workers, self.MAX_WORKERS_CAP)
 
         self.options = {'server': JIRA_SERVER}
         self.auth = JIRA(self.options, token_auth=auth_key)
-
-        # Keep your original JQL semantics
+        for scheme in ("http://", "https://"):
+            self.auth._session.mount(scheme, _HTTP_ADAPTER)
+
+        # Keep your original JQL semantics, plus a server-side text
+        # prefilter so features without the committed marker never leave
+        # JIRA. Lucene tokenizes away the '#', so the bare token is what
+        # the index can match; the Python regex below stays as the
+        # authoritative confirmation on the smaller result set.
         self.jql_query = (
             f'"Target SW Release" in ("{self.rocm} [{unique_key}]") '
-            f'AND Project in ("Software Development") AND type = Feature'
+            f'AND Project in ("Software Development") AND type = Feature '
+            f'AND description ~ "teams_committed"'
         )
 
-        # Precompile regex for performance
-        self._qa_committed_pattern = re.compile(r'#teams_committed.*?QA', re.IGNORECASE)
-        self._auto_pattern = re.compile(r'auto', re.IGNORECASE)
-        self._tms_pattern = re.compile(r'tms', re.IGNORECASE)
 
     # ------------- Helpers -------------
     @staticmethod
@@ -73,19 +128,78 @@ class TicketFetch:
         if chunk:
             yield chunk
 
+    def _search_raw(self, jql: str, fields: str, max_results: int = 1000):
+        """
+        POST straight to /rest/api/2/search, paging at PAGE_SIZE rows per
+        call instead of the wrapper's 50, and wrap the JSON payload in
+        lightweight _Obj views rather than full Issue proxies.
+        """
+        issues: List[object] = []
+        start = 0
+        url = JIRA_SERVER.rstrip('/') + "/rest/api/2/search"
+        while start < max_results:
+            resp = self.auth._session.post(url, json={
+                "jql": jql,
+                "fields": fields.split(','),
+                "maxResults": min(self.PAGE_SIZE, max_results - start),
+                "startAt": start,
+                "validateQuery": False,
+            })
+            resp.raise_for_status()
+            data = resp.json()
+            batch = data.get("issues", [])
+            issues.extend(_Obj(issue) for issue in batch)
+            start += len(batch)
+            if not batch or start >= data.get("total", 0):
+                break
+        return issues
+
+    def _parallel_search(self, jql: str, fields: str, page_size: int = 100):
+        """
+        Fan out a paged search: probe the total with a zero-row request,
+        then fetch all pages concurrently with varying startAt so the
+        whole query costs about one page's latency instead of one per
+        page.
+        """
+        url = JIRA_SERVER.rstrip('/') + "/rest/api/2/search"
+
+        probe = self.auth._session.post(url, json={
+            "jql": jql, "fields": ["key"], "maxResults": 0,
+            "startAt": 0, "validateQuery": False,
+        })
+        probe.raise_for_status()
+        total = min(probe.json().get("total", 0), self.MAX_RESULTS)
+        if total <= page_size:
+            return self._search_issues_with_backoff(
+                jql, fields=fields, max_results=max(total, 1))
+
+        def fetch_page(start: int):
+            resp = self.auth._session.post(url, json={
+                "jql": jql,
+                "fields": fields.split(','),
+                "maxResults": min(page_size, total - start),
+                "startAt": start,
+                "validateQuery": False,
+            })
+            resp.raise_for_status()
+            return resp.json().get("issues", [])
+
+        starts = range(0, total, page_size)
+        # executor.map keeps page order, so results concatenate in the
+        # same order a sequential walk would produce.
+        with ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(starts))) as exe:
+            pages = list(exe.map(fetch_page, starts))
+        return [_Obj(issue) for page in pages for issue in page]
+
     def _search_issues_with_backoff(self, jql: str, fields: str, max_results: int = 1000):
         """
-        Wrapper to call JIRA.search_issues with retries/backoff for transient failures (e.g., 429, 5xx).
+        Wrapper around _search_raw with retries/backoff for transient failures (e.g., 429, 5xx).
         """
         delay = self.BACKOFF_BASE_SEC
         for attempt in range(self.BACKOFF_MAX_RETRIES + 1):
             try:
-                return self.auth.search_issues(
-                    jql,
-                    maxResults=max_results,
-                    validate_query=False,
-                    fields=fields
-                )
+                return self._search_raw(jql, fields=fields, max_results=max_results)
             except Exception as e:
                 # Retry on transient errors; otherwise re-raise
                 if attempt >= self.BACKOFF_MAX_RETRIES:
@@ -115,17 +229,14 @@ class TicketFetch:
         if self.verbose:
             print(f"[info] Bulk fetching {len(keys)} issues in {len(chunks)} chunk(s)")
 
-        # Parallelize chunk fetches to improve wall-clock time
-        if self.MAX_WORKERS and self.MAX_WORKERS > 1 and len(chunks) > 1:
-            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as exe:
-                futures = {exe.submit(fetch_chunk, chunk): chunk for chunk in chunks}
-                for fut in as_completed(futures):
-                    issues = fut.result()
-                    for issue in issues:
-                        key_to_issue[issue.key] = issue
-        else:
-            for chunk in chunks:
-                issues = fetch_chunk(chunk)
+        # Parallelize chunk fetches to improve wall-clock time. All
+        # chunks are submitted up front and drained as they complete;
+        # a single-chunk call just runs on one pooled worker.
+        workers = min(self.MAX_WORKERS or 1, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as exe:
+            futures = {exe.submit(fetch_chunk, chunk): chunk for chunk in chunks}
+            for fut in as_completed(futures):
+                issues = fut.result()
                 for issue in issues:
                     key_to_issue[issue.key] = issue
 
@@ -135,10 +246,16 @@ class TicketFetch:
         """
         Builds the final dict for a row in the output, handling NAs & optional Auto/TMS discovery.
         """
+        # Bind the fields containers once; every access through the
+        # proxy objects goes via __getattr__, so repeated descents add
+        # up over thousands of rows.
+        feature_fields = feature_task.fields
+        qa_fields = qa_task.fields if qa_task is not None else None
+
         row = {
             '_id': feature_task.key+"|"+qa_task.key if qa_task is not None else feature_task.key,
-            'Feature_status': getattr(feature_task.fields.status, 'name', 'NA'),
-            'Feature_summary': getattr(feature_task.fields, 'summary', 'NA'),
+            'Feature_status': getattr(feature_fields.status, 'name', 'NA'),
+            'Feature_summary': getattr(feature_fields, 'summary', 'NA'),
             'QA_task': "NA",
             'QA_status': "NA",
             'QA_assignee': "NA",
@@ -156,49 +273,60 @@ class TicketFetch:
 
         # QA fields
         row['QA_task'] = qa_task.key
-        row['QA_status'] = getattr(getattr(qa_task.fields, 'status', None), 'name', 'NA')
+        row['QA_status'] = getattr(getattr(qa_fields, 'status', None), 'name', 'NA')
 
-        assignee = getattr(qa_task.fields, 'assignee', None)
+        assignee = getattr(qa_fields, 'assignee', None)
         if assignee:
             # Prefer displayName if available, else use name or accountId
             display = getattr(assignee, 'displayName', None) or getattr(assignee, 'name', None) or getattr(assignee, 'accountId', None)
             row['QA_assignee'] = display or "NA"
 
-        labels = getattr(qa_task.fields, 'labels', None) or []
+        labels = getattr(qa_fields, 'labels', None) or []
         row['QA_labels'] = ", ".join(labels) if labels else "NA"
 
         # Try to find Auto/TMS tasks from QA issue links (without extra network calls)
-        issuelinks = getattr(qa_task.fields, 'issuelinks', None) or []
+        issuelinks = getattr(qa_fields, 'issuelinks', None) or []
+        auto_found = tms_found = False
         for link in issuelinks:
+            # Stop walking links entirely once both are classified.
+            if auto_found and tms_found:
+                break
             for issue_side in ('inwardIssue', 'outwardIssue'):
                 linked = getattr(link, issue_side, None)
                 if not linked:
                     continue
 
                 # Only consider Task issuetype
+                li_fields = getattr(linked, 'fields', None)
                 try:
-                    is_task = getattr(getattr(linked, 'fields', None), 'issuetype', None)
+                    is_task = getattr(li_fields, 'issuetype', None)
                     if not is_task or getattr(is_task, 'name', '') != 'Task':
                         continue
                 except Exception:
                     continue
 
                 # We need summary & status for classification
-                li_fields = getattr(linked, 'fields', None)
                 summary = getattr(li_fields, 'summary', '') if li_fields else ''
                 status_name = getattr(getattr(li_fields, 'status', None), 'name', 'NA') if li_fields else 'NA'
                 key = getattr(linked, 'key', None)
 
-                if summary and self._auto_pattern.search(summary) and row['Auto_task'] == "NA":
+                # Plain substring checks; the old auto/tms regexes were
+                # literal patterns, so `in` on the lowered string gives
+                # the same matches without the regex engine.
+                summary_lower = summary.lower() if summary else ''
+
+                if not auto_found and 'auto' in summary_lower:
+                    auto_found = True
                     row['Auto_task'] = key or "NA"
                     row['Auto_status'] = status_name or "NA"
 
-                if summary and self._tms_pattern.search(summary) and row['TMS_task'] == "NA":
+                if not tms_found and 'tms' in summary_lower:
+                    tms_found = True
                     row['TMS_task'] = key or "NA"
                     row['TMS_status'] = status_name or "NA"
 
                 # If both found, we can stop scanning
-                if row['Auto_task'] != "NA" and row['TMS_task'] != "NA":
+                if auto_found and tms_found:
                     break
 
         return row
@@ -210,7 +338,7 @@ class TicketFetch:
         selected = []
         for t in feature_tasks:
             desc = getattr(t.fields, 'description', '') or ''
-            if isinstance(desc, str) and self._qa_committed_pattern.search(desc):
+            if isinstance(desc, str) and _QA_COMMITTED_PATTERN.search(desc):
                 selected.append(t)
         return selected
 
@@ -220,18 +348,23 @@ class TicketFetch:
         We will validate issuetype/triage via the bulk-fetched issues.
         """
         keys = []
+        append = keys.append
         links = getattr(feature_task.fields, 'issuelinks', None) or []
         for link in links:
+            # Check the link type first on the raw dict — two plain
+            # lookups with no throwaway {} default — before paying for
+            # the proxy attribute resolution of the linked issue.
+            link_type = link.raw.get('type')
+            if link_type is None or link_type.get('inward') != 'Comprised of Task':
+                continue
+
             linked_issue = getattr(link, 'inwardIssue', None) or getattr(link, 'outwardIssue', None)
             if not linked_issue:
                 continue
 
-            # Preserve your original link-type check
-            link_type_inward = link.raw.get('type', {}).get('inward')
-            if link_type_inward == 'Comprised of Task':
-                key = getattr(linked_issue, 'key', None)
-                if key:
-                    keys.append(key)
+            key = getattr(linked_issue, 'key', None)
+            if key:
+                append(key)
         return keys
 
     def _qa_filter(self, issue_obj) -> bool:
@@ -265,8 +398,8 @@ class TicketFetch:
         # 1) Fetch candidate feature tasks (minimal fields)
         if self.verbose:
             print("[info] Fetching feature tasks ...")
-        feature_tasks = self._search_issues_with_backoff(
-            self.jql_query, fields=self.FIELDS_FEATURE, max_results=self.MAX_RESULTS
+        feature_tasks = self._parallel_search(
+            self.jql_query, fields=self.FIELDS_FEATURE
         )
 
         # 2) Filter by QA committed marker
@@ -287,6 +420,12 @@ class TicketFetch:
             print(f"[info] Bulk fetching candidate linked issues: {len(all_linked_keys)}")
         linked_issues_map = self._bulk_fetch_issues_by_keys(all_linked_keys, fields=self.FIELDS_QA)
 
+        # Run the QA filter once per fetched issue; a QA task linked
+        # from several features is evaluated a single time and the
+        # per-feature loop reduces to dict lookups.
+        valid_qa = {k: issue for k, issue in linked_issues_map.items()
+                    if self._qa_filter(issue)}
+
         # 5) Build result rows
         rows: List[Dict[str, str]] = []
 
@@ -295,21 +434,26 @@ class TicketFetch:
             qa_added = False
 
             for k in keys:
-                qa_issue = linked_issues_map.get(k)
-                if qa_issue and self._qa_filter(qa_issue):
+                qa_issue = valid_qa.get(k)
+                if qa_issue is not None:
                     rows.append(self.get_task_details(feature_task, qa_issue))
                     qa_added = True
 
             if not qa_added:
                 rows.append(self.get_task_details(feature_task, None))
 
-            if self.verbose:
-                print(f"Latest info fetched for {feature_task.key}  ({idx}/{len(qa_committed_features)})")
+            # One stdout syscall per row is measurable at scale; emit
+            # periodic progress plus a final summary instead.
+            if self.verbose and (idx % 50 == 0 or idx == len(qa_committed_features)):
+                print(f"[info] Processed {idx}/{len(qa_committed_features)} features "
+                      f"({len(rows)} rows)")
 
-        df = pd.DataFrame(rows)
         if self.is_json:
-            return df.to_json(orient="records")
-        return df
+            # Hand back the rows as built; callers on this path feed
+            # them straight to Mongo, so the DataFrame + to_json round
+            # trip was a full copy for nothing.
+            return rows
+        return pd.DataFrame(rows)
 
 
 # -----------------------------